@@ -66,3 +66,31 @@ def test_detail_bezier_epsilon_ok(vsk, scale, points):
 
     assert line_count_equal(vsk, 1)
     assert _max_segment_length(vsk.document.layers[1][0]) < DETAIL
+
+
+def test_detail_epsilon_follows_transform(vsk):
+    vsk.detail(0.1)
+    assert vsk.epsilon == pytest.approx(0.1)
+
+    with vsk.pushMatrix():
+        vsk.scale(4)
+        assert vsk.epsilon == pytest.approx(0.025)
+        vsk.detail(0.2)
+        assert vsk.epsilon == pytest.approx(0.05)
+        vsk.rotate(1.0)
+        assert vsk.epsilon == pytest.approx(0.05)
+
+    assert vsk.epsilon == pytest.approx(0.2)
+    vsk.scale(2, 10)
+    assert vsk.epsilon == pytest.approx(0.02)
+    vsk.resetMatrix()
+    assert vsk.epsilon == pytest.approx(0.2)
+
+
+def test_detail_epsilon_transform_modified_in_place(vsk):
+    vsk.detail(0.1)
+    vsk.scale(2)
+    assert vsk.epsilon == pytest.approx(0.05)
+
+    vsk.transform[:2, :2] *= 5
+    assert vsk.epsilon == pytest.approx(0.01)
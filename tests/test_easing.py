@@ -9,3 +9,19 @@ def test_easing_func_range(mode: str) -> None:
     for i in np.linspace(0, 1.0, num=51):
         for a in range(10):
             assert 0 <= vsketch.EASING_FUNCTIONS[mode](i, a)
+
+
+@pytest.mark.parametrize("mode", vsketch.EASING_FUNCTIONS.keys())
+def test_easing_func_scalar_matches_array(mode: str) -> None:
+    values = np.linspace(0, 1.0, num=51)
+    out = vsketch.EASING_FUNCTIONS[mode](values, 3)
+    for i, v in enumerate(values):
+        assert np.isclose(vsketch.EASING_FUNCTIONS[mode](v, 3), out[i])
+
+
+@pytest.mark.parametrize(
+    "mode", [mode for mode in vsketch.EASING_FUNCTIONS if "inout" in mode]
+)
+def test_easing_func_inout_scalar_type(mode: str) -> None:
+    for v in (0.25, 0.75):
+        assert isinstance(vsketch.EASING_FUNCTIONS[mode](v, 3), float)
@@ -1,6 +1,10 @@
+import abc
+import math
+import pickle
+
 import pytest
 
-from vsketch.sketch_class import Param
+from vsketch.sketch_class import Param, SketchClass
 
 
 @pytest.mark.parametrize(
@@ -22,3 +26,109 @@ def test_float_param_bounds(initial_value, min_value, max_value, set_value):
     float_param = Param(initial_value, min_value=min_value, max_value=max_value)
     float_param.set_value_with_validation(set_value)
     assert float_param.value == min(max_value, max(min_value, set_value))
+
+
+@pytest.mark.parametrize(
+    ["set_value", "expected"],
+    [
+        ["True", True],
+        ["yes", True],
+        ["1", True],
+        ["False", False],
+        ["no", False],
+        ["0", False],
+        [True, True],
+        [False, False],
+        [1, True],
+        [0, False],
+    ],
+)
+def test_bool_param_conversion(set_value, expected):
+    bool_param = Param(not expected)
+    assert bool_param.set_value_with_validation(set_value)
+    assert bool_param.value is expected
+
+
+@pytest.mark.parametrize(
+    ["min_value", "max_value", "set_value", "expected"],
+    [
+        [0, None, -3, 0],
+        [0, None, 3, 3],
+        [None, 0, 3, 0],
+        [None, 0, -3, -3],
+        [None, None, 42, 42],
+    ],
+)
+def test_int_param_single_bound(min_value, max_value, set_value, expected):
+    int_param = Param(1, min_value=min_value, max_value=max_value)
+    assert int_param.set_value_with_validation(set_value)
+    assert int_param.value == expected
+
+
+def test_param_choices_validation():
+    str_param = Param("a", choices=["a", "b", "c"])
+    assert str_param.set_value_with_validation("b")
+    assert str_param.value == "b"
+    assert not str_param.set_value_with_validation("d")
+    assert str_param.value == "b"
+
+
+def test_sketch_class_params():
+    class MySketch(SketchClass):
+        size = Param(3)
+        name = Param("a", choices=["a", "b"])
+        other = 5
+
+    params = MySketch.get_params()
+    assert set(params) == {"size", "name"}
+    assert params["size"] is MySketch.__dict__["size"]
+
+    params.clear()
+    assert set(MySketch.get_params()) == {"size", "name"}
+
+    MySketch.set_param_set({"size": 7, "other": 6, "missing": 1})
+    assert MySketch.get_params()["size"].value == 7
+    assert MySketch.other == 5
+
+    # parameters may be added and removed after the class is created
+    setattr(MySketch, "late", Param(2))
+    MySketch.set_param_set({"late": 4})
+    assert set(MySketch.get_params()) == {"size", "name", "late"}
+    assert MySketch.get_params()["late"].value == 4
+
+    delattr(MySketch, "name")
+    assert set(MySketch.get_params()) == {"size", "late"}
+
+
+def test_sketch_class_abc_mixin():
+    class MySketch(SketchClass, abc.ABC):
+        size = Param(3)
+
+    assert set(MySketch.get_params()) == {"size"}
+
+
+def test_param_unit_scaling():
+    class MySketch(SketchClass):
+        margin = Param(10.0, unit="cm")
+
+    sketch = MySketch.__new__(MySketch)
+    param = MySketch.get_params()["margin"]
+    assert sketch.margin == pytest.approx(10.0 * 96 / 2.54)
+    param.set_value(5.0)
+    assert sketch.margin == pytest.approx(5.0 * 96 / 2.54)
+    param.value = 1.0
+    assert sketch.margin == pytest.approx(96 / 2.54)
+
+
+def test_param_nan_is_clamped():
+    float_param = Param(0.5, 0.0, 1.0)
+    assert float_param.set_value_with_validation(math.nan)
+    assert float_param.value == 0.0
+
+
+def test_param_pickle():
+    param = Param(0.5, 0.0, 1.0, unit="mm")
+    copy = pickle.loads(pickle.dumps(param))
+    assert copy.value == 0.5
+    assert copy.set_value_with_validation(2.0)
+    assert copy.value == 1.0
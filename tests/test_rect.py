@@ -2,6 +2,7 @@ from typing import Sequence, Tuple
 
 import numpy as np
 import pytest
+import vpype as vp
 
 import vsketch
 
@@ -39,6 +40,12 @@ def test_rect_mode_success(
     assert line_exists(vsk, np.array(expected, dtype=complex), strict=False)
 
 
+def test_rect_vertex_order(vsk: vsketch.Vsketch) -> None:
+    # plain rectangles must follow the same path as vpype's, like rounded ones do
+    vsk.rect(1, 2, 3, 4)
+    assert np.array_equal(vsk.document.layers[1][0], vp.rect(1, 2, 3, 4))
+
+
 def test_rect_arg_fail(vsk: vsketch.Vsketch) -> None:
     # vsk.rect() expects 3 float args + optional `h` float and `mode` arg
     with pytest.raises(TypeError):
@@ -0,0 +1,241 @@
+import numpy as np
+import pytest
+from shapely.geometry import MultiLineString, MultiPoint, MultiPolygon, Polygon
+
+import vsketch
+
+
+def test_shape_union(vsk):
+    shp = vsk.createShape()
+    shp.square(0, 0, 2)
+    shp.square(1, 0, 2)
+    area, _, _ = shp._compile(False, False)
+    assert np.isclose(area.area, 6)
+    assert area.bounds == (0, 0, 3, 2)
+
+
+def test_shape_operation_order(vsk):
+    # union after difference must not be affected by the difference
+    shp = vsk.createShape()
+    shp.square(0, 0, 4)
+    shp.square(1, 1, 2, op="difference")
+    shp.square(1.5, 1.5, 1)
+    area, _, _ = shp._compile(False, False)
+    assert np.isclose(area.area, 16 - 4 + 1)
+
+
+def test_shape_consecutive_differences(vsk):
+    shp = vsk.createShape()
+    shp.square(0, 0, 10)
+    for i in range(5):
+        shp.square(2 * i, 0, 1, op="difference")
+    area, _, _ = shp._compile(False, False)
+    assert np.isclose(area.area, 100 - 5)
+
+
+@pytest.mark.parametrize(
+    ["op", "expected_area"],
+    [("union", 7), ("difference", 3), ("intersection", 1), ("symmetric_difference", 6)],
+)
+def test_shape_operations(vsk, op, expected_area):
+    shp = vsk.createShape()
+    shp.square(0, 0, 2)
+    shp.square(1, 1, 2, op=op)
+    area, _, _ = shp._compile(False, False)
+    assert np.isclose(area.area, expected_area)
+
+
+def test_shape_combine_pending(vsk):
+    other = vsk.createShape()
+    other.square(0, 0, 2)
+    other.square(1, 1, 2)
+
+    shp = vsk.createShape()
+    shp.shape(other)
+    area, _, _ = shp._compile(False, False)
+    assert np.isclose(area.area, 7)
+
+
+def test_shape_invalid_op(vsk):
+    shp = vsk.createShape()
+    with pytest.raises(ValueError):
+        shp.square(0, 0, 1, op="xor")
+
+
+def test_shape_invalid_ring(vsk):
+    shp = vsk.createShape()
+    shp.square(0, 0, 1)
+    with pytest.raises(ValueError):
+        shp.polygon([(0, 0), (1, 1), (0, 0)])
+    with pytest.raises(ValueError):
+        shp.polygon([(0, 0), (5, 0), (5, 5)], holes=[[(1, 1), (2, 2)]], close=True)
+
+    # the shape is still usable
+    shp.square(1, 0, 1)
+    polygons, _, _ = shp._compile(False, False)
+    assert polygons.area == pytest.approx(2)
+
+
+@pytest.mark.parametrize("mask_points", [True, False])
+def test_shape_points(vsk, mask_points):
+    shp = vsk.createShape()
+    shp.square(0, 0, 2)
+    for i in range(100):
+        shp.point(i, 10)
+    shp.point(1, 1)
+
+    other = vsk.createShape()
+    other.point(5, 5)
+    shp.shape(other)
+
+    _, _, points = shp._compile(False, mask_points)
+    assert len(points.geoms) == (101 if mask_points else 102)
+    assert (5, 5) in [(p.x, p.y) for p in points.geoms]
+
+
+def test_shape_mask_lines(vsk):
+    shp = vsk.createShape()
+    shp.square(0, 0, 2)
+    shp.line(0.5, 0.5, 1.5, 1.5)  # fully inside
+    shp.line(5, 5, 6, 6)  # fully outside
+    shp.line(1, 1, 3, 1)  # crossing
+
+    _, lines, _ = shp._compile(True, False)
+    assert np.isclose(lines.length, np.sqrt(2) + 1)
+
+
+def test_shape_polygon_inputs(vsk):
+    shp = vsk.createShape()
+    shp.polygon([0, 2, 2, 0], [0, 0, 2, 2], close=True)
+    shp.polygon([3 + 0j, 4 + 0j, 4 + 1j, 3 + 1j, 3 + 0j])
+    shp.polygon([(5, 0), (6, 0), (6, 1), (5, 1)], close=True)
+    shp.triangle(7, 0, 8, 0, 8, 1)
+    area, _, _ = shp._compile(False, False)
+    assert np.isclose(area.area, 4 + 1 + 1 + 0.5)
+
+
+def test_shape_repeated_circles(vsk):
+    shp = vsk.createShape()
+    shp.circle(0, 0, radius=1)
+    shp.circle(10, 0, radius=1)
+    area, _, _ = shp._compile(False, False)
+    assert len(area.geoms) == 2
+    assert np.isclose(area.geoms[0].area, area.geoms[1].area)
+    assert np.isclose(area.bounds[2], 11)
+
+
+@pytest.mark.parametrize(
+    ["op", "expected_area"],
+    [("union", 4), ("difference", 0), ("intersection", 0), ("symmetric_difference", 4)],
+)
+def test_shape_operations_on_empty(vsk, op, expected_area):
+    shp = vsk.createShape()
+    shp.square(0, 0, 2, op=op)
+    area, _, _ = shp._compile(False, False)
+    assert np.isclose(area.area, expected_area)
+
+
+def test_shape_consecutive_intersections(vsk):
+    shp = vsk.createShape()
+    shp.square(0, 0, 4)
+    shp.square(1, 0, 4, op="intersection")
+    shp.square(0, 1, 4, op="intersection")
+    shp.square(0, 0, 1)
+    area, _, _ = shp._compile(False, False)
+    assert np.isclose(area.area, 9 + 1)
+
+
+def test_shape_mask_many_lines(vsk):
+    shp = vsk.createShape()
+    shp.square(0, 0, 10)
+    for i in range(50):
+        shp.line(-5, i, 15, i)
+
+    _, lines, _ = shp._compile(True, False)
+    # lines 0 to 10 are cut by the square, including those running along its edges
+    assert np.isclose(lines.length, 11 * 10 + 39 * 20)
+
+
+def test_shape_polygon_holes(vsk):
+    shp = vsk.createShape()
+    shp.polygon(
+        [(0, 0), (4, 0), (4, 4), (0, 4), (0, 0)],
+        holes=[[(1, 1), (2, 1), (2, 2), (1, 2)], [(3, 3), (3.5, 3), (3.5, 3.5), (3, 3)]],
+    )
+    area, _, _ = shp._compile(False, False)
+    assert np.isclose(area.area, 16 - 1 - 0.125)
+
+
+def test_shape_geometry(vsk):
+    shp = vsk.createShape()
+    shp.geometry(
+        MultiPolygon(
+            [
+                Polygon([(0, 0), (4, 0), (4, 4), (0, 4)], [[(1, 1), (2, 1), (2, 2), (1, 2)]]),
+                Polygon([(5, 0), (6, 0), (6, 1), (5, 1)]),
+            ]
+        )
+    )
+    shp.geometry(MultiLineString([[(10, 0), (11, 0)], [(10, 1), (12, 1)]]))
+    shp.geometry(MultiPoint([(20, 0), (21, 0)]))
+
+    area, lines, points = shp._compile(False, False)
+    assert np.isclose(area.area, 16 - 1 + 1)
+    assert np.isclose(lines.length, 3)
+    assert len(points.geoms) == 2
+
+
+def test_shape_union_drops_collinear_vertices(vsk):
+    shp = vsk.createShape()
+    for i in range(10):
+        shp.square(i, 0, 1)
+    area, _, _ = shp._compile(False, False)
+    assert np.isclose(area.area, 10)
+    # the ring's start point may itself be collinear and is kept
+    assert len(area.geoms[0].exterior.coords) <= 6
+
+
+def test_shape_mixed_operations(vsk):
+    shp = vsk.createShape()
+    shp.square(0, 0, 2, op="symmetric_difference")
+    shp.square(1, 1, 2, op="symmetric_difference")
+    shp.square(0, 0, 3, op="intersection")
+    shp.square(0, 0, 1, op="difference")
+    shp.square(3, 3, 1)
+    area, _, _ = shp._compile(False, False)
+    assert np.isclose(area.area, 6 - 1 + 1)
+
+
+def test_shape_rect(vsk):
+    shp = vsk.createShape()
+    shp.rect(0, 0, 4, 2)
+    shp.rect(10, 0, 4, 2, 0.5)
+    area, _, _ = shp._compile(False, False)
+    areas = sorted(polygon.area for polygon in area.geoms)
+    assert areas[0] < 8
+    assert np.isclose(areas[1], 8)
+
+
+def test_shape_many_operations(vsk):
+    shp = vsk.createShape()
+    for i in range(2000):
+        shp.square(i, 0, 1)
+    shp.square(0, 0, 1000, op="difference")
+    area, _, _ = shp._compile(False, False)
+    assert np.isclose(area.area, 1000)
+
+
+def test_vsketch_shape_points(vsk):
+    shp = vsk.createShape()
+    for i in range(10):
+        shp.point(i, 0)
+    vsk.shape(shp)
+
+    ref = vsketch.Vsketch()
+    for i in range(10):
+        ref.point(i, 0)
+
+    lc = vsk.document.layers[1]
+    ref_lc = ref.document.layers[1]
+    assert len(lc) == len(ref_lc) == 10
+    assert lc.bounds() == pytest.approx(ref_lc.bounds())
@@ -61,3 +61,28 @@ def test_sketch_recursive(vsk):
     assert line_exists(vsk, UNIT_SQUARE + 2)
     assert line_exists(vsk, UNIT_SQUARE + 2j)
     assert line_exists(vsk, UNIT_SQUARE + 2 + 2j)
+
+
+class _CenteredSketch(vsketch.SketchClass):
+    finalize_count = 0
+
+    def draw(self, vsk: vsketch.Vsketch) -> None:
+        vsk.size(100, 50)
+        vsk.rect(0, 0, 10, 20)
+
+    def finalize(self, vsk: vsketch.Vsketch) -> None:
+        type(self).finalize_count += 1
+
+
+def test_sketch_class_execute_centering():
+    sketch = _CenteredSketch.execute()
+    assert sketch is not None
+    assert np.allclose(sketch.vsk.document.bounds(), (45, 15, 55, 35))
+    assert _CenteredSketch.finalize_count == 0
+
+    sketch = _CenteredSketch.execute(finalize=True)
+    assert sketch is not None
+    assert np.allclose(sketch.vsk.document.bounds(), (45, 15, 55, 35))
+    assert _CenteredSketch.finalize_count == 1
+    sketch.ensure_finalized()
+    assert _CenteredSketch.finalize_count == 1
@@ -1,6 +1,9 @@
 import numpy as np
 import pytest
 import vpype as vp
+from shapely.geometry import LineString
+
+from vsketch.style import _calc_buffer_resolution, stylize_paths
 
 from .utils import line_count_equal
 
@@ -31,3 +34,72 @@ def test_stroke_weight_detail(vsk, weight, detail_mm):
         seg_length = np.abs(np.diff(line))
         idx = (seg_length <= detail_px) | (seg_length > 140)
         assert np.all(idx)
+
+
+@pytest.mark.parametrize("weight", list(range(1, 8)))
+def test_stroke_weight_polygon_holes(vsk, weight):
+    vsk.strokeWeight(weight)
+    vsk.polygon(
+        [(0, 0), (100, 0), (100, 100), (0, 100)],
+        holes=[
+            [(20, 20), (40, 20), (40, 40), (20, 40), (20, 20)],
+            [(60, 60), (80, 60), (80, 80), (60, 60)],
+        ],
+        close=True,
+    )
+
+    assert line_count_equal(vsk, 3 * weight)
+
+
+def _stylize_reference(line, weight, pen_width, detail, join_style):
+    """Per-path buffering with Shapely's object API, as a reference for stylize_paths()."""
+    geom = LineString([(pt.real, pt.imag) for pt in line])
+    paths: list[np.ndarray] = []
+    if weight % 2 == 0:
+        radii = [pen_width / 2 + k * pen_width for k in range(weight // 2)]
+    else:
+        paths.append(line)
+        radii = [k * pen_width for k in range(1, (weight + 1) // 2)]
+
+    for radius in radii:
+        poly = geom.buffer(
+            radius, quad_segs=_calc_buffer_resolution(radius, detail), join_style=join_style
+        )
+        for ring in [poly.exterior, *poly.interiors]:
+            coords = np.array(ring.coords)
+            paths.append(coords[:, 0] + 1j * coords[:, 1])
+    return paths
+
+
+@pytest.mark.parametrize("weight", list(range(1, 8)))
+def test_stylize_paths_reference(weight):
+    lines = [vp.circle(0, 0, 50, 0.1), vp.rect(100, 100, 30, 40), np.array([0, 10 + 10j, 20])]
+    expected: list[np.ndarray] = []
+    for line in lines:
+        expected.extend(_stylize_reference(line, weight, 2.0, 0.1, "mitre"))
+
+    lc = stylize_paths(lines, weight, 2.0, 0.1, "mitre")
+
+    assert len(lc) == len(expected)
+    for line, expected_line in zip(lc, expected):
+        assert np.allclose(line, expected_line)
+
+
+def test_stylize_paths_bounds():
+    # weight 5: the rectangle itself and two buffers of radius 2 and 4, each with an interior
+    lc = stylize_paths([vp.rect(100, 100, 30, 40)], 5, 2.0, 0.1, "mitre")
+
+    assert len(lc) == 5
+    assert np.allclose(lc.bounds(), (96, 96, 134, 144))
+
+
+def test_stylize_paths_degenerate():
+    lines = [np.array([5 + 5j]), np.array([0, 0]), np.array([0, 10])]
+    lc = stylize_paths(lines, 3, 2.0, 0.1, "mitre")
+
+    # vpype drops the single-vertex path itself, but not its buffered outline
+    assert len(lc) == 5
+    assert np.allclose(np.abs(lc[0] - (5 + 5j)), 2.0)
+    assert np.allclose(lc[1], [0, 0])
+    assert np.allclose(np.abs(lc[2]), 2.0)
+    assert np.allclose(lc[3], [0, 10])
@@ -99,3 +99,34 @@ def test_pushMatrix_context(vsk):
     vsk.polygon(POLYGON)
     assert line_count_equal(vsk, 1)
     assert line_exists(vsk, POLYGON)
+
+
+def test_transform_matrix_composition(vsk):
+    vsk.translate(3, -2)
+    vsk.rotate(0.3)
+    vsk.scale(2, 5)
+    vsk.rotate(-40, degrees=True)
+    vsk.translate(-1, 7)
+
+    c1, s1 = np.cos(0.3), np.sin(0.3)
+    c2, s2 = np.cos(np.radians(-40)), np.sin(np.radians(-40))
+    expected = (
+        np.array([[1, 0, 3], [0, 1, -2], [0, 0, 1]])
+        @ np.array([[c1, -s1, 0], [s1, c1, 0], [0, 0, 1]])
+        @ np.diag([2, 5, 1])
+        @ np.array([[c2, -s2, 0], [s2, c2, 0], [0, 0, 1]])
+        @ np.array([[1, 0, -1], [0, 1, 7], [0, 0, 1]])
+    )
+    assert np.allclose(vsk.transform, expected)
+
+
+def test_transform_writable_after_reset(vsk):
+    vsk.transform[0, 2] = 5
+    vsk.polygon(POLYGON)
+    vsk.resetMatrix()
+    vsk.transform[1, 2] = 3
+    vsk.polygon(POLYGON)
+
+    assert line_count_equal(vsk, 2)
+    assert line_exists(vsk, POLYGON + 5)
+    assert line_exists(vsk, POLYGON + 3j)
@@ -58,6 +58,32 @@ def _cubic_bezier(
     )
 
 
+def _cubic_bezier_complex(
+    p1: complex, p2: complex, p3: complex, p4: complex, positions: np.ndarray
+) -> np.ndarray:
+    """Compute cubic bezier at positions, with control points and result as complex.
+
+    The curve is evaluated in its power basis with Horner's scheme, in place. Since rounding
+    may slightly offset the end point, the curve's end points are set exactly if included
+    in ``positions``.
+    """
+
+    a = -p1 + 3 * (p2 - p3) + p4
+    b = 3 * (p1 - 2 * p2 + p3)
+    c = 3 * (p2 - p1)
+
+    path = a * positions
+    path += b
+    path *= positions
+    path += c
+    path *= positions
+    path += p1
+
+    path[positions == 0] = p1
+    path[positions == 1] = p4
+    return path
+
+
 def _cubic_bezier_interpolate(
     x1: float,
     y1: float,
@@ -68,45 +94,47 @@ def _cubic_bezier_interpolate(
     x4: float,
     y4: float,
     detail: float,
-) -> tuple[np.ndarray, np.ndarray]:
+) -> np.ndarray:
     """Strategy:
 
     1) estimate length:
         - rough estimate according to https://stackoverflow.com/a/37862545/229511
-        - linspace at 10x details
 
-    2) produce final curve
-        - linspace at 5x details with correct length
+    2) measure length:
+        - linspace at 5x details based on the estimated length
+
+    3) produce final curve
+        - resample at detail + 15% based on the curvilinear abscissa of the previous step
+
+    Both coordinates are evaluated at once by using complex control points, which directly
+    yields the complex path.
     """
 
+    p1, p2, p3, p4 = complex(x1, y1), complex(x2, y2), complex(x3, y3), complex(x4, y4)
+
     # produce a length estimate based on the average between the chord and the path going
     # through all control points
-    chord = math.hypot(x4 - x1, y4 - y1)
-    cont_net = (
-        math.hypot(x2 - x1, y2 - y1)
-        + math.hypot(x3 - x2, y3 - y2)
-        + math.hypot(x4 - x3, y4 - y3)
-    )
+    chord = abs(p4 - p1)
+    cont_net = abs(p2 - p1) + abs(p3 - p2) + abs(p4 - p3)
     length_estimate = (chord + cont_net) / 2
 
-    # produce a sampling at 10x details, based on estimated length
-    s = np.linspace(0, 1, max(3, math.ceil(length_estimate / detail / 10)))
-    x, y = _cubic_bezier(x1, y1, x2, y2, x3, y3, x4, y4, s)
-    length = np.sum(np.hypot(np.diff(x), np.diff(y)))
-
-    # based on the properly estimated length, produce a sampling at 5x details
-    s = np.linspace(0, 1, max(3, math.ceil(length / detail / 5)))
-    x, y = _cubic_bezier(x1, y1, x2, y2, x3, y3, x4, y4, s)
+    # based on the estimated length, produce a sampling at 5x details
+    s = np.linspace(0, 1, max(3, math.ceil(length_estimate / detail / 5)))
+    path = _cubic_bezier_complex(p1, p2, p3, p4, s)
 
-    # compute curvilinear abscissa and produce final sampling, at detail + 15%
-    curv_absc = np.cumsum(np.hstack([0, np.hypot(np.diff(x), np.diff(y))]))
+    # compute curvilinear abscissa, which also yields the actual length, and produce final
+    # sampling, at detail + 15%
+    curv_absc = np.empty(len(path))
+    curv_absc[0] = 0
+    np.cumsum(np.abs(np.diff(path)), out=curv_absc[1:])
+    length = curv_absc[-1]
     new_s: np.ndarray = np.interp(
-        np.linspace(0, curv_absc[-1], max(3, math.ceil(1.15 * length / detail))),
+        np.linspace(0, length, max(3, math.ceil(1.15 * length / detail))),
         curv_absc,
         s,
     )
 
-    return _cubic_bezier(x1, y1, x2, y2, x3, y3, x4, y4, new_s)
+    return _cubic_bezier_complex(p1, p2, p3, p4, new_s)
 
 
 @overload
@@ -177,8 +205,7 @@ def cubic_bezier_path(
     """Compute a piece-wise linear path approximating a quadratic bezier. Length of individual
     segments is close to but never greater than ``detail``."""
 
-    x, y = _cubic_bezier_interpolate(x1, y1, x2, y2, x3, y3, x4, y4, detail)
-    return x + 1j * y
+    return _cubic_bezier_interpolate(x1, y1, x2, y2, x3, y3, x4, y4, detail)
 
 
 def cubic_bezier_point(
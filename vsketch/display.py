@@ -5,6 +5,8 @@ import matplotlib.pyplot as plt
 import numpy as np
 import vpype as vp
 
+from .utils import cached_convert_length
+
 COLORS = [
     (0, 0, 1),
     (0, 0.5, 0),
@@ -17,6 +19,40 @@ COLORS = [
 ]
 
 
+def _lines_as_2d(lc: vp.LineCollection, offset: complex, scale: float) -> list[np.ndarray]:
+    """Convert the lines of a collection to (N, 2) arrays of coordinates with offset and scale
+    applied.
+
+    All lines are concatenated in a single complex buffer, to which offset and scale are
+    applied in one pass. This buffer is then reinterpreted as interleaved X/Y coordinates and
+    split into per-line views.
+    """
+    if len(lc) == 0:
+        return []
+
+    buf = np.concatenate(list(lc)).astype(complex, copy=False)
+    buf += offset
+    xy = buf.view(np.float64).reshape(-1, 2)
+    xy *= scale
+    return np.split(xy, np.cumsum([len(line) for line in lc])[:-1])
+
+
+def _pen_up_segments(lc: vp.LineCollection, offset: complex, scale: float) -> list[np.ndarray]:
+    """Build the pen-up trajectories of a collection as a list of (2, 2) arrays, with offset
+    and scale applied.
+
+    Only the line endpoints are needed, so the lines' coordinates are not converted. The
+    segments are computed in a single (N-1, 2, 2) array, of which views are returned.
+    """
+    starts = np.array([line[0] for line in lc], dtype=complex)
+    ends = np.array([line[-1] for line in lc], dtype=complex)
+    segs = np.stack([ends[:-1], starts[1:]], axis=1)
+    segs += offset
+    xy = segs.view(np.float64).reshape(-1, 2, 2)
+    xy *= scale
+    return list(xy)
+
+
 def display(
     document: vp.Document,
     page_size: tuple[float, float] | None = None,
@@ -48,7 +84,7 @@ def display(
         unit: display unit
         fig_size: if provided, set the matplotlib figure size
     """
-    scale = 1 / vp.convert_length(unit)
+    scale = 1 / cached_convert_length(unit)
 
     if fig_size:
         plt.figure(figsize=fig_size)
@@ -76,7 +112,6 @@ def display(
                 (page_size[0] - (bounds[2] - bounds[0])) / 2.0 - bounds[0],
                 (page_size[1] - (bounds[3] - bounds[1])) / 2.0 - bounds[1],
             )
-    offset_ndarr = np.array([offset.real, offset.imag])
 
     # plot all layers
     color_idx = 0
@@ -95,7 +130,7 @@ def display(
 
         # noinspection PyUnresolvedReferences
         layer_lines = matplotlib.collections.LineCollection(
-            [vp.as_vector(line + offset) * scale for line in lc],
+            _lines_as_2d(lc, offset, scale),
             color=color,
             lw=1,
             alpha=0.5,
@@ -107,13 +142,7 @@ def display(
         if show_pen_up:
             # noinspection PyUnresolvedReferences
             pen_up_lines = matplotlib.collections.LineCollection(
-                [
-                    (
-                        (vp.as_vector(lc[i])[-1] + offset_ndarr) * scale,
-                        (vp.as_vector(lc[i + 1])[0] + offset_ndarr) * scale,
-                    )
-                    for i in range(len(lc) - 1)
-                ],
+                _pen_up_segments(lc, offset, scale),
                 color=(0, 0, 0),
                 lw=0.5,
                 alpha=0.5,
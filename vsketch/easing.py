@@ -1,44 +1,168 @@
 from __future__ import annotations
 
 import math
+from typing import Any, Callable
 
 import numpy as np
 
 
-def _circ_inout(v):
-    v = np.array(v)
-    out = np.empty_like(v)
+def _piecewise_inout(
+    v: float | np.ndarray,
+    a: float,
+    low: Callable[[Any, float], Any],
+    high: Callable[[Any, float], Any],
+) -> float | np.ndarray:
+    """Evaluate ``low(v, a)`` for ``v < 0.5`` and ``high(v, a)`` otherwise.
+
+    Unlike ``np.where``, each branch is only evaluated on the values it applies to, and scalar
+    inputs bypass array allocation entirely.
+    """
+    if np.ndim(v) == 0:
+        return low(v, a) if v < 0.5 else high(v, a)
+
+    v = np.asarray(v)
+    out = np.empty(v.shape, dtype=float)
     mask = v < 0.5
-    out[mask] = -0.5 * (np.sqrt(1 - 4 * v[mask] ** 2) - 1)
+    out[mask] = low(v[mask], a)
     mask = ~mask
-    out[mask] = np.sqrt(-(v[mask] - 1.5) * (v[mask] - 0.5)) + 0.5
+    out[mask] = high(v[mask], a)
     return out
 
 
+def _linear(v, a):
+    return v
+
+
+def _quad_in(v, a):
+    return v * v
+
+
+def _quad_out(v, a):
+    return -v * (v - 2)
+
+
+def _quad_inout_low(v, a):
+    return 2 * v * v
+
+
+def _quad_inout_high(v, a):
+    return -2 * v * (v - 2) - 1
+
+
+def _quad_inout(v, a):
+    return _piecewise_inout(v, a, _quad_inout_low, _quad_inout_high)
+
+
+def _cubic_in(v, a):
+    return v * v * v
+
+
+def _cubic_out(v, a):
+    return (v - 1) ** 3 + 1
+
+
+def _cubic_inout_low(v, a):
+    return 4 * v * v * v
+
+
+def _cubic_inout_high(v, a):
+    return 4 * (v - 1) ** 3 + 1
+
+
+def _cubic_inout(v, a):
+    return _piecewise_inout(v, a, _cubic_inout_low, _cubic_inout_high)
+
+
+def _power_in(v, a):
+    return v**a
+
+
+def _power_out(v, a):
+    return 1 - (1 - v) ** a
+
+
+def _power_inout_low(v, a):
+    return (2 * v) ** a / 2
+
+
+def _power_inout_high(v, a):
+    return 1.0 - 0.5 * (2 - 2 * v) ** a
+
+
+def _power_inout(v, a):
+    return _piecewise_inout(v, a, _power_inout_low, _power_inout_high)
+
+
+def _sin_in(v, a):
+    return 1.0 - np.cos(v * math.pi / 2)
+
+
+def _sin_out(v, a):
+    return np.sin(v * math.pi / 2)
+
+
+def _sin_inout(v, a):
+    return 0.5 * (1 - np.cos(v * math.pi))
+
+
+def _exp_in(v, a):
+    return 2 ** (a * (v - 1))
+
+
+def _exp_out(v, a):
+    return 1 - 2 ** (-a * v)
+
+
+def _exp_inout_low(v, a):
+    return (2 ** (a * (2 * v - 1))) / 2
+
+
+def _exp_inout_high(v, a):
+    return 1 - 2 ** (a * (1 - 2 * v) - 1)
+
+
+def _exp_inout(v, a):
+    return _piecewise_inout(v, a, _exp_inout_low, _exp_inout_high)
+
+
+def _circ_in(v, a):
+    return -(np.sqrt(1 - v * v) - 1)
+
+
+def _circ_out(v, a):
+    return np.sqrt(-v * (v - 2))
+
+
+def _circ_inout_low(v, a):
+    return -0.5 * (np.sqrt(1 - 4 * v**2) - 1)
+
+
+def _circ_inout_high(v, a):
+    return np.sqrt(-(v - 1.5) * (v - 0.5)) + 0.5
+
+
+def _circ_inout(v, a):
+    return _piecewise_inout(v, a, _circ_inout_low, _circ_inout_high)
+
+
 EASING_FUNCTIONS = {
-    "linear": lambda v, a: v,
-    "quad_in": lambda v, a: v * v,
-    "quad_out": lambda v, a: -v * (v - 2),
-    "quad_inout": lambda v, a: np.where(v < 0.5, 2 * v * v, -2 * v * (v - 2) - 1),
-    "cubic_in": lambda v, a: v * v * v,
-    "cubic_out": lambda v, a: (v - 1) ** 3 + 1,
-    "cubic_inout": lambda v, a: np.where(v < 0.5, 4 * v * v * v, 4 * (v - 1) ** 3 + 1),
-    "power_in": lambda v, a: v**a,
-    "power_out": lambda v, a: 1 - (1 - v) ** a,
-    "power_inout": lambda v, a: np.where(
-        v < 0.5, (2 * v) ** a / 2, 1.0 - 0.5 * (2 - 2 * v) ** a
-    ),
-    "sin_in": lambda v, a: 1.0 - np.cos(v * math.pi / 2),
-    "sin_out": lambda v, a: np.sin(v * math.pi / 2),
-    "sin_inout": lambda v, a: 0.5 * (1 - np.cos(v * math.pi)),
-    "exp_in": lambda v, a: 2 ** (a * (v - 1)),
-    "exp_out": lambda v, a: 1 - 2 ** (-a * v),
-    "exp_inout": lambda v, a: np.where(
-        v < 0.5,
-        (2 ** (a * (2 * v - 1))) / 2,
-        1 - 2 ** (a * (1 - 2 * v) - 1),
-    ),
-    "circ_in": lambda v, a: -(np.sqrt(1 - v * v) - 1),
-    "circ_out": lambda v, a: np.sqrt(-v * (v - 2)),
-    "circ_inout": lambda v, a: _circ_inout(v),
+    "linear": _linear,
+    "quad_in": _quad_in,
+    "quad_out": _quad_out,
+    "quad_inout": _quad_inout,
+    "cubic_in": _cubic_in,
+    "cubic_out": _cubic_out,
+    "cubic_inout": _cubic_inout,
+    "power_in": _power_in,
+    "power_out": _power_out,
+    "power_inout": _power_inout,
+    "sin_in": _sin_in,
+    "sin_out": _sin_out,
+    "sin_inout": _sin_inout,
+    "exp_in": _exp_in,
+    "exp_out": _exp_out,
+    "exp_inout": _exp_inout,
+    "circ_in": _circ_in,
+    "circ_out": _circ_out,
+    "circ_inout": _circ_inout,
 }
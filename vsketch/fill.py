@@ -3,8 +3,10 @@ from __future__ import annotations
 import math
 
 import numpy as np
+import shapely
 import vpype as vp
 from shapely.geometry import MultiLineString, Polygon
+from shapely.strtree import STRtree
 
 from .utils import complex_to_2d
 
@@ -33,6 +35,9 @@ def generate_fill(poly: Polygon, pen_width: float, stroke_width: float) -> vp.Li
         # too small, nothing to fill
         return vp.LineCollection()
 
+    # the hatch area is offset by half a pen width from the boundary
+    p_interior = p.buffer(-pen_width / 2, join_style=2, mitre_limit=10.0)
+
     min_x, min_y, max_x, max_y = p.bounds
     height = max_y - min_y
     line_count = math.ceil(height / pen_width) + 1
@@ -44,10 +49,11 @@ def generate_fill(poly: Polygon, pen_width: float, stroke_width: float) -> vp.Li
         seg = base_seg + (y_start + pen_width * n) * 1j
         segs.append(seg if n % 2 == 0 else np.flip(seg))
 
-    # mls = MultiLineString([[(pt.real, pt.imag) for pt in seg] for seg in segs]).intersection(
-    mls = MultiLineString([complex_to_2d(seg) for seg in segs]).intersection(
-        p.buffer(-pen_width / 2, join_style=2, mitre_limit=10.0)
-    )
+    # only hatch lines which actually cross the fill area are intersected with it, which
+    # saves a lot of work for sparse polygons (e.g. thin diagonal shapes or disjoint parts)
+    hatch_lines = shapely.linestrings([complex_to_2d(seg) for seg in segs])
+    candidates = np.sort(STRtree(hatch_lines).query(p_interior, predicate="intersects"))
+    mls = MultiLineString(list(hatch_lines[candidates])).intersection(p_interior)
 
     lc = vp.LineCollection(mls)
     lc.merge(tolerance=pen_width * 5, flip=True)
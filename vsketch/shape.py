@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import itertools
 from typing import TYPE_CHECKING, Iterable, Literal, Sequence, cast
 
 import numpy as np
+import shapely
 import vpype as vp
 from shapely.geometry import (
     LinearRing,
@@ -13,10 +15,19 @@ from shapely.geometry import (
     Point,
     Polygon,
 )
+from shapely.geometry.base import BaseGeometry
 from shapely.ops import unary_union
 
 from .curves import cubic_bezier_path
-from .utils import compute_ellipse_mode
+from .utils import (
+    as_float_array,
+    cached_arc,
+    cached_ellipse,
+    complex_to_2d,
+    compute_ellipse_mode,
+    compute_rect_mode,
+    split_by_index,
+)
 
 if TYPE_CHECKING:
     from . import Vsketch
@@ -28,6 +39,35 @@ BooleanOperation = Literal["union", "difference", "intersection", "symmetric_dif
 Options: one of 'union', 'difference', 'intersection', or 'symmetric_difference'
 """
 
+_BOOLEAN_OPERATIONS = frozenset(
+    ["union", "difference", "intersection", "symmetric_difference"]
+)
+
+# pending operations are applied once this many are queued, to bound memory usage while
+# keeping batches large enough for unary_union() to be efficient
+_MAX_PENDING_OPERATIONS = 1024
+
+# above this number of lines, masking candidates are pre-selected with a spatial index
+_STRTREE_MIN_LINES = 32
+
+_PolygonData = tuple[np.ndarray, list[np.ndarray]]
+
+
+def _build_polygons(polygon_data: list[_PolygonData]) -> np.ndarray:
+    """Build an array of polygons from their (exterior, holes) 2D coordinates.
+
+    All polygons are constructed at once from a ragged array, instead of one
+    :class:`Polygon` instantiation per polygon. All rings must be closed.
+    """
+    rings = [ring for exterior, holes in polygon_data for ring in (exterior, *holes)]
+    ring_offsets = np.zeros(len(rings) + 1, dtype=np.int64)
+    np.cumsum([len(ring) for ring in rings], out=ring_offsets[1:])
+    polygon_offsets = np.zeros(len(polygon_data) + 1, dtype=np.int64)
+    np.cumsum([1 + len(holes) for _, holes in polygon_data], out=polygon_offsets[1:])
+    return shapely.from_ragged_array(
+        shapely.GeometryType.POLYGON, np.concatenate(rings), (ring_offsets, polygon_offsets)
+    )
+
 
 class Shape:
     """Reusable and drawable shape with support for boolean operations.
@@ -88,36 +128,159 @@ class Shape:
     def __init__(self, vsk: Vsketch):
         self._vsk = vsk
         self._polygon = Polygon()
-        self._lines: list[LineString] = []
-        self._points: list[Point] = []
+        self._pending: list[tuple[BooleanOperation, _PolygonData]] = []
+        self._simplified_coord_count = 0
+        self._lines: list[np.ndarray] = []
+        self._line_array_cache: np.ndarray | None = None
+        self._lines_cache: MultiLineString | None = None
+        self._points_xy = np.empty((64, 2), dtype=float)
+        self._point_count = 0
+
+    def _flush_pending(self) -> None:
+        """Apply pending boolean operations to the shape's area.
+
+        Boolean operations are not applied immediately but recorded, such that all pending
+        polygons can be built at once, and runs of consecutive identical operations can be
+        applied together (e.g. with a single ``unary_union()`` for many unions), which is
+        much faster than many pairwise operations.
+        """
+        if not self._pending:
+            return
+
+        try:
+            polygons = _build_polygons([data for _, data in self._pending])
+            ops = [op for op, _ in self._pending]
+        finally:
+            self._pending.clear()
+
+        start = 0
+        for op, run in itertools.groupby(ops):
+            count = len(list(run))
+            self._apply_operation(op, polygons[start : start + count])
+            start += count
+
+    def _apply_operation(self, op: BooleanOperation, polygons: np.ndarray) -> None:
+        """Apply the same boolean operation with several polygons to the shape's area."""
+        # A run is merged on its own before being combined with the area (or applied
+        # pairwise if it holds a single polygon), so the area is never re-unioned from scratch.
+        if op == "union":
+            if self._polygon.is_empty:
+                self._polygon = unary_union(polygons)
+            elif len(polygons) == 1:
+                self._polygon = self._polygon.union(polygons[0])
+            else:
+                self._polygon = self._polygon.union(unary_union(polygons))
+
+            # Unions leave behind collinear vertices where primitives' boundaries met. They
+            # are removed (losslessly, with a 0 tolerance) whenever the vertex count doubles,
+            # to keep subsequent operations on the area cheap.
+            coord_count = shapely.get_num_coordinates(self._polygon)
+            if coord_count > 2 * self._simplified_coord_count:
+                self._polygon = shapely.simplify(self._polygon, 0)
+                self._simplified_coord_count = shapely.get_num_coordinates(self._polygon)
+        elif op == "symmetric_difference":
+            for polygon in polygons:
+                if self._polygon.is_empty:
+                    self._polygon = polygon
+                else:
+                    self._polygon = self._polygon.symmetric_difference(polygon)
+        elif self._polygon.is_empty:
+            pass  # difference and intersection leave an empty area empty
+        elif op == "difference":
+            if len(polygons) == 1:
+                self._polygon = self._polygon.difference(polygons[0])
+            else:
+                self._polygon = self._polygon.difference(unary_union(polygons))
+        elif op == "intersection":
+            self._polygon = self._polygon.intersection(shapely.intersection_all(polygons))
 
     def _add_polygon(
         self,
         exterior: np.ndarray,
         holes: Sequence[np.ndarray] = (),
         op: BooleanOperation = "union",
+        *,
+        closed: bool | None = None,
     ) -> None:
-        if exterior[0] != exterior[-1]:
+        """Add a polygon (if closed) or a line (otherwise) to the shape.
+
+        Args:
+            exterior: exterior ring or line as a complex array
+            holes: holes as complex arrays (closed polygons only)
+            op: boolean operation (closed polygons only)
+            closed: whether ``exterior`` is closed, computed from its endpoints if None
+        """
+        self._add_polygon_xy(
+            complex_to_2d(exterior),
+            [complex_to_2d(hole) for hole in holes],
+            op=op,
+            closed=closed,
+        )
+
+    def _add_polygon_xy(
+        self,
+        exterior: np.ndarray,
+        holes: Sequence[np.ndarray] = (),
+        op: BooleanOperation = "union",
+        *,
+        closed: bool | None = None,
+    ) -> None:
+        """Same as :meth:`_add_polygon`, but with rings provided as (N, 2) float arrays."""
+        if closed is None:
+            closed = exterior[0].tolist() == exterior[-1].tolist()
+
+        if not closed:
             if len(holes) > 0:
                 raise ValueError("holes are not supported for open lines")
             if op != "union":
                 raise ValueError(
                     f"operation {op} unsupported for open lines (must be 'union')"
                 )
-            self._lines.append(LineString(vp.as_vector(exterior)))
+            self._lines.append(exterior)
+            self._line_array_cache = None
+            self._lines_cache = None
         else:
-            p = Polygon(vp.as_vector(exterior), [vp.as_vector(hole) for hole in holes])
-            if op == "union":
-                self._polygon = self._polygon.union(p)
-            elif op == "difference":
-                self._polygon = self._polygon.difference(p)
-            elif op == "intersection":
-                self._polygon = self._polygon.intersection(p)
-            elif op == "symmetric_difference":
-                self._polygon = self._polygon.symmetric_difference(p)
-            else:
+            if op not in _BOOLEAN_OPERATIONS:
                 raise ValueError(f"operation {op} invalid")
 
+            holes = [
+                hole if hole[0].tolist() == hole[-1].tolist() else np.vstack([hole, hole[:1]])
+                for hole in holes
+            ]
+
+            # validate rings now, as polygons are only built when pending operations are applied
+            if len(exterior) < 4 or any(len(hole) < 4 for hole in holes):
+                raise ValueError("a polygon ring requires at least 4 coordinates")
+
+            # while the area is empty, difference and intersection are no-ops
+            if (
+                op in ("difference", "intersection")
+                and not self._pending
+                and self._polygon.is_empty
+            ):
+                return
+
+            self._pending.append((op, (exterior, holes)))
+            if len(self._pending) >= _MAX_PENDING_OPERATIONS:
+                self._flush_pending()
+
+    def _line_array(self) -> np.ndarray:
+        """Returns the shape's lines as an array of :class:`LineString`.
+
+        Lines are stored as coordinate arrays and only built into Shapely geometries, with a
+        single vectorized call, when needed. The result is cached until lines are added.
+        """
+        if self._line_array_cache is None:
+            if self._lines:
+                lengths = [len(line) for line in self._lines]
+                indices = np.repeat(np.arange(len(self._lines)), lengths)
+                self._line_array_cache = shapely.linestrings(
+                    np.concatenate(self._lines), indices=indices
+                )
+            else:
+                self._line_array_cache = np.empty(0, dtype=object)
+        return self._line_array_cache
+
     def _compile(
         self, mask_lines: bool, mask_points: bool
     ) -> tuple[MultiPolygon, MultiLineString, MultiPoint]:
@@ -138,6 +301,8 @@ class Shape:
             length
         """
 
+        self._flush_pending()
+
         # normalize area
         if self._polygon.is_empty:
             area = MultiPolygon()
@@ -148,11 +313,27 @@ class Shape:
         else:
             raise RuntimeError(f"incorrect type for Shape._polygon: {type(self._polygon)}")
 
+        # predicates against a prepared geometry reuse its spatial index across calls
+        shapely.prepare(area)
+
         # normalize/mask lines
         if mask_lines:
-            lines = unary_union(
-                [line.difference(area) for line in self._lines if not line.is_empty]
-            )
+            line_array = self._line_array().copy()
+
+            # only lines whose bounding box intersects the area's may be affected
+            if len(line_array) > _STRTREE_MIN_LINES:
+                idx = shapely.STRtree(line_array).query(area)
+            else:
+                idx = np.arange(len(line_array))
+            idx = idx[shapely.intersects(area, line_array[idx])]
+
+            covered = shapely.covers(area, line_array[idx])
+            keep = np.ones(len(line_array), dtype=bool)
+            keep[idx[covered]] = False
+            idx = idx[~covered]
+            line_array[idx] = shapely.difference(line_array[idx], area)
+            keep[idx[shapely.is_empty(line_array[idx])]] = False
+            lines = unary_union(line_array[keep])
 
             if lines.is_empty:
                 lines = MultiLineString()
@@ -161,12 +342,20 @@ class Shape:
             elif not isinstance(lines, MultiLineString):
                 raise RuntimeError(f"incorrect type for masked lines: {type(lines)}")
         else:
-            lines = MultiLineString(self._lines)
+            if self._lines_cache is None:
+                line_array = self._line_array()
+                if len(line_array) > 0:
+                    self._lines_cache = shapely.multilinestrings(line_array)
+                else:
+                    self._lines_cache = MultiLineString()
+            lines = self._lines_cache
 
         # normalize/mask points
-        points = MultiPoint(
-            [point for point in self._points if not mask_points or not point.intersects(area)]
-        )
+        points_xy = self._points_xy[: self._point_count]
+        if mask_points and len(points_xy) > 0 and not area.is_empty:
+            masked = shapely.intersects_xy(area, points_xy[:, 0], points_xy[:, 1])
+            points_xy = points_xy[~masked]
+        points = shapely.multipoints(points_xy) if len(points_xy) > 0 else MultiPoint()
 
         return area, lines, points
 
@@ -177,7 +366,18 @@ class Shape:
             y: Y coordinate of the point
         """
 
-        self._points.append(Point(x, y))
+        self._extend_points(np.array([[x, y]], dtype=float))
+
+    def _extend_points(self, xy: np.ndarray) -> None:
+        """Append a (N, 2) array of point coordinates to the point buffer, growing it
+        geometrically as needed."""
+        count = self._point_count + len(xy)
+        if count > len(self._points_xy):
+            buffer = np.empty((max(count, 2 * len(self._points_xy)), 2), dtype=float)
+            buffer[: self._point_count] = self._points_xy[: self._point_count]
+            self._points_xy = buffer
+        self._points_xy[self._point_count : count] = xy
+        self._point_count = count
 
     def line(self, x1: float, y1: float, x2: float, y2: float) -> None:
         """Add a line to the shape.
@@ -189,7 +389,7 @@ class Shape:
             y2: Y coordinate of ending point
         """
 
-        self._add_polygon(np.array([x1 + y1 * 1j, x2 + y2 * 1j], dtype=complex))
+        self._add_polygon_xy(np.array([[x1, y1], [x2, y2]], dtype=float), closed=False)
 
     def circle(
         self,
@@ -311,8 +511,8 @@ class Shape:
         if mode is None:
             # noinspection PyProtectedMember
             mode = self._vsk._ellipse_mode
-        line = vp.ellipse(*compute_ellipse_mode(mode, x, y, w, h), self._vsk.epsilon)
-        self._add_polygon(line, op=op)
+        line = cached_ellipse(*compute_ellipse_mode(mode, x, y, w, h), self._vsk.epsilon)
+        self._add_polygon(line, op=op, closed=True)
 
     def arc(
         self,
@@ -375,12 +575,16 @@ class Shape:
             mode = self._vsk._ellipse_mode
 
         cx, cy, rw, rh = compute_ellipse_mode(mode, x, y, w, h)
-        line = vp.arc(cx, cy, rw, rh, start, stop, self._vsk.epsilon)
-        if close == "chord":
-            line = np.append(line, [line[0]])
+        if close == "no":
+            line = cached_arc(cx, cy, rw, rh, start, stop, self._vsk.epsilon)
+        elif close == "chord":
+            line = cached_arc(cx, cy, rw, rh, start, stop, self._vsk.epsilon, padding=1)
+            line[-1] = line[0]
         elif close == "pie":
-            line = np.append(line, [complex(cx, cy), line[0]])
-        elif close != "no":
+            line = cached_arc(cx, cy, rw, rh, start, stop, self._vsk.epsilon, padding=2)
+            line[-2] = complex(cx, cy)
+            line[-1] = line[0]
+        else:
             raise ValueError("close must be one of 'no', 'chord', 'pie'")
 
         self._add_polygon(line, op=op)
@@ -486,21 +690,18 @@ class Shape:
             # noinspection PyProtectedMember
             mode = self._vsk._rect_mode
 
-        if mode == "corner":
-            line = vp.rect(x, y, w, h, tl, tr, br, bl, self._vsk.epsilon)
-        elif mode == "corners":
-            #  Find top-left corner
-            tl_x, tl_y = min(x, w), min(y, h)
-            width, height = max(x, w) - tl_x, max(y, h) - tl_y
-            line = vp.rect(tl_x, tl_y, width, height, tl, tr, br, bl, self._vsk.epsilon)
-        elif mode == "center":
-            line = vp.rect(x - w / 2, y - h / 2, w, h, tl, tr, br, bl, self._vsk.epsilon)
-        elif mode == "radius":
-            line = vp.rect(x - w, y - h, 2 * w, 2 * h, tl, tr, br, bl, self._vsk.epsilon)
+        rect_x, rect_y, rect_w, rect_h = compute_rect_mode(mode, x, y, w, h)
+        if tl == tr == br == bl == 0:
+            # plain rectangles don't need vpype's rounded corner logic
+            x2, y2 = rect_x + rect_w, rect_y + rect_h
+            line_xy = np.array(
+                [[rect_x, rect_y], [rect_x, y2], [x2, y2], [x2, rect_y], [rect_x, rect_y]],
+                dtype=float,
+            )
+            self._add_polygon_xy(line_xy, op=op, closed=True)
         else:
-            raise ValueError("mode must be one of 'corner', 'corners', 'center', 'radius'")
-
-        self._add_polygon(line, op=op)
+            line = vp.rect(rect_x, rect_y, rect_w, rect_h, tl, tr, br, bl, self._vsk.epsilon)
+            self._add_polygon(line, op=op, closed=True)
 
     def square(
         self,
@@ -589,11 +790,8 @@ class Shape:
             y4: Y coordinate of the last vertex
             op: one of 'union', 'difference', 'intersection', or 'symmetric_difference'
         """
-        line = np.array(
-            [x1 + y1 * 1j, x2 + y2 * 1j, x3 + y3 * 1j, x4 + y4 * 1j, x1 + y1 * 1j],
-            dtype=complex,
-        )
-        self._add_polygon(line, op=op)
+        line = np.array([[x1, y1], [x2, y2], [x3, y3], [x4, y4], [x1, y1]], dtype=float)
+        self._add_polygon_xy(line, op=op, closed=True)
 
     def triangle(
         self,
@@ -633,10 +831,8 @@ class Shape:
             op: one of 'union', 'difference', 'intersection', or 'symmetric_difference'
         """
 
-        line = np.array(
-            [x1 + y1 * 1j, x2 + y2 * 1j, x3 + y3 * 1j, x1 + y1 * 1j], dtype=complex
-        )
-        self._add_polygon(line, op=op)
+        line = np.array([[x1, y1], [x2, y2], [x3, y3], [x1, y1]], dtype=float)
+        self._add_polygon_xy(line, op=op, closed=True)
 
     def polygon(
         self,
@@ -690,6 +886,7 @@ class Shape:
             close: the polygon is closed if True
             op: one of 'union', 'difference', 'intersection', or 'symmetric_difference'
         """
+        buffer = None
         if y is None:
             try:
                 if hasattr(x, "__len__"):
@@ -698,9 +895,9 @@ class Shape:
                     data = np.array(list(x))
 
                 if len(data.shape) == 1 and data.dtype == complex:
-                    line = data
+                    line = complex_to_2d(data)
                 elif len(data.shape) == 2 and data.shape[1] == 2:
-                    line = data[:, 0] + 1j * data[:, 1]
+                    line = data.astype(float)
                 else:
                     raise ValueError()
             except:
@@ -709,9 +906,15 @@ class Shape:
                 )
         else:
             try:
-                line = np.array(
-                    [complex(c[0], c[1]) for c in zip(x, y)], dtype=complex  # type: ignore
-                )
+                xs = as_float_array(x)  # type: ignore
+                ys = as_float_array(y)
+                count = min(len(xs), len(ys))
+
+                # spare row for the closing vertex, if any
+                buffer = np.empty((count + 1, 2), dtype=float)
+                buffer[:count, 0] = xs[:count]
+                buffer[:count, 1] = ys[:count]
+                line = buffer[:count]
             except:
                 raise ValueError(
                     "when both X and Y are provided, they must be sequences o float"
@@ -720,14 +923,23 @@ class Shape:
         hole_lines = []
         try:
             for hole in holes:
-                hole_lines.append(np.array([complex(c[0], c[1]) for c in hole], dtype=complex))
+                hole_line = np.asarray(hole, dtype=float)
+                if len(hole_line.shape) != 2 or hole_line.shape[1] < 2:
+                    raise ValueError()
+                hole_lines.append(hole_line[:, :2])
         except:
             raise ValueError("holes must be a sequence of sequence of 2D coordinates")
 
-        if close and line[-1] != line[0]:
-            line = np.hstack([line, line[0]])
+        closed = line[0].tolist() == line[-1].tolist()
+        if close and not closed:
+            if buffer is not None:
+                buffer[-1] = line[0]
+                line = buffer
+            else:
+                line = np.vstack([line, line[:1]])
+            closed = True
 
-        self._add_polygon(line, holes=hole_lines, op=op)
+        self._add_polygon_xy(line, holes=hole_lines, op=op, closed=closed)
 
     def geometry(
         self,
@@ -762,35 +974,31 @@ class Shape:
             shape (Shapely geometry): a supported shapely geometry object
             op: one of 'union', 'difference', 'intersection', or 'symmetric_difference'
         """
-        if getattr(shape, "is_empty", False):
+        if not isinstance(shape, BaseGeometry):
+            raise ValueError("the input must be a supported Shapely geometry")
+        if shape.is_empty:
             return
 
-        try:
-            if shape.geom_type in ["LineString", "LinearRing"]:
-                self.polygon(shape.coords, op=op)
-            elif shape.geom_type == "MultiLineString":
-                for ls in shape.geoms:
-                    self.polygon(ls.coords, op=op)
-            elif shape.geom_type in ["Polygon", "MultiPolygon"]:
-                if shape.geom_type == "Polygon":
-                    poly_list = [shape]
-                else:
-                    poly_list = shape.geoms
-                for p in poly_list:
-                    self.polygon(
-                        p.exterior.coords, holes=[hole.coords for hole in p.interiors], op=op
-                    )
-            elif shape.geom_type in ["Point", "MultiPoint"]:
-                if shape.geom_type == "Point":
-                    point_list = [shape]
-                else:
-                    point_list = shape.geoms
-                for p in point_list:
-                    self.point(p.x, p.y)
-            else:
-                raise ValueError("unsupported Shapely geometry")
-        except AttributeError:
-            raise ValueError("the input must be a supported Shapely geometry")
+        if isinstance(shape, (LineString, MultiLineString)):
+            coords, line_idx = shapely.get_coordinates(
+                shapely.get_parts(shape), return_index=True
+            )
+            for line in split_by_index(coords, line_idx):
+                self._add_polygon_xy(line, op=op)
+        elif isinstance(shape, (Polygon, MultiPolygon)):
+            rings, polygon_idx = shapely.get_rings(shapely.get_parts(shape), return_index=True)
+            coords, ring_idx = shapely.get_coordinates(rings, return_index=True)
+            ring_coords = split_by_index(coords, ring_idx)
+            starts = np.flatnonzero(np.diff(polygon_idx, prepend=-1))
+            ends = np.append(starts[1:], len(polygon_idx))
+            for start, end in zip(starts, ends):
+                self._add_polygon_xy(
+                    ring_coords[start], ring_coords[start + 1 : end], op=op, closed=True
+                )
+        elif isinstance(shape, (Point, MultiPoint)):
+            self._extend_points(shapely.get_coordinates(shape))
+        else:
+            raise ValueError("unsupported Shapely geometry")
 
     def bezier(
         self,
@@ -847,8 +1055,11 @@ class Shape:
             shape: the shape to combine
             op: one of 'union', 'difference', 'intersection', or 'symmetric_difference'
         """
+        shape._flush_pending()
         self.geometry(shape._polygon, op=op)
 
         if op == "union":
             self._lines.extend(shape._lines)
-            self._points.extend(shape._points)
+            self._line_array_cache = None
+            self._lines_cache = None
+            self._extend_points(shape._points_xy[: shape._point_count])
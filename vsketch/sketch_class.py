@@ -3,12 +3,12 @@ from __future__ import annotations
 import os
 import pathlib
 import random
-from typing import Any, Generic, Iterable, Optional, TypeVar, Union, overload
+from typing import Any, Callable, Generic, Iterable, Optional, TypeVar, Union, overload
 
 import numpy as np
 import vpype as vp
 
-from .utils import working_directory
+from .utils import cached_convert_length, working_directory
 from .vsketch import Vsketch
 
 ParamType = Union[int, float, bool, str]
@@ -45,18 +45,25 @@ class SketchClass:
 
         self.finalize(self._vsk)
 
+        self._center_document()
+        self._finalized = True
+
+    def _center_document(self) -> None:
         # vsk is not reused, so we can just hack into it's document instead of using a deep
         # copy like vsk.display() and vsk.save()
-        if self.vsk.centered and self.vsk.document.page_size is not None:
-            bounds = self.vsk.document.bounds()
-            if bounds is not None:
-                width, height = self.vsk.document.page_size
-                self.vsk.document.translate(
-                    (width - (bounds[2] - bounds[0])) / 2.0 - bounds[0],
-                    (height - (bounds[3] - bounds[1])) / 2.0 - bounds[1],
-                )
+        document = self._vsk.document
+        if not self._vsk.centered or document.page_size is None:
+            return
 
-        self._finalized = True
+        bounds = document.bounds()
+        if bounds is None:
+            return
+
+        # offset that moves the center of the bounds to the center of the page
+        width, height = document.page_size
+        document.translate(
+            (width - bounds[0] - bounds[2]) * 0.5, (height - bounds[1] - bounds[3]) * 0.5
+        )
 
     @classmethod
     def execute(
@@ -64,8 +71,8 @@ class SketchClass:
         seed: int | None = None,
         finalize: bool = False,
     ) -> Optional[SketchClass]:
-        cwd = getattr(cls, "__vsketch_cwd__", pathlib.Path(os.getcwd()))
-        with working_directory(cwd):
+        cwd = getattr(cls, "__vsketch_cwd__", None)
+        with working_directory(cwd if cwd is not None else pathlib.Path(os.getcwd())):
             sketch = cls()
             if sketch is None:
                 return None
@@ -79,17 +86,9 @@ class SketchClass:
             if finalize:
                 sketch.ensure_finalized()
 
-        # vsk is not reused, so we can just hack into it's document instead of using a deep
-        # copy like vsk.display() and vsk.save()
-        vsk = sketch.vsk
-        if vsk.centered and vsk.document.page_size is not None:
-            bounds = vsk.document.bounds()
-            if bounds is not None:
-                width, height = vsk.document.page_size
-                vsk.document.translate(
-                    (width - (bounds[2] - bounds[0])) / 2.0 - bounds[0],
-                    (height - (bounds[3] - bounds[1])) / 2.0 - bounds[1],
-                )
+        # finalization already centers the document
+        if not finalize:
+            sketch._center_document()
 
         return sketch
 
@@ -127,18 +126,16 @@ class SketchClass:
 
     @classmethod
     def get_params(cls) -> dict[str, Param]:
-        res = {}
-        for name in cls.__dict__:
-            param = getattr(cls, name)
-            if isinstance(param, Param):
-                res[name] = param
-        return res
+        return {
+            name: param for name, param in cls.__dict__.items() if isinstance(param, Param)
+        }
 
     @classmethod
     def set_param_set(cls, param_set: dict[str, Any]) -> None:
         for name, value in param_set.items():
-            if name in cls.__dict__ and isinstance(cls.__dict__[name], Param):
-                cls.__dict__[name].set_value_with_validation(value)
+            param = cls.__dict__.get(name)
+            if isinstance(param, Param):
+                param.set_value_with_validation(value)
 
     @property
     def param_set(self) -> dict[str, Any]:
@@ -148,6 +145,13 @@ class SketchClass:
 _T = TypeVar("_T")
 
 
+def _to_bool(v: Any) -> bool:
+    # bool("False") == True, so we need to check for str first
+    if isinstance(v, str):
+        return v.lower() in ("true", "1", "yes", "y")
+    return bool(v)
+
+
 class Param(Generic[_T]):
     """Generic parameter for :class:`SketchClass`.
 
@@ -156,6 +160,20 @@ class Param(Generic[_T]):
     configuration and parameter space exploration with ``vsk save``.
     """
 
+    __slots__ = (
+        "value",
+        "type",
+        "_convert",
+        "min",
+        "max",
+        "step",
+        "decimals",
+        "unit",
+        "factor",
+        "choices",
+        "_choice_set",
+    )
+
     def __init__(
         self,
         value: _T,
@@ -209,17 +227,22 @@ class Param(Generic[_T]):
         """
         self.value: _T = value
         self.type = type(value)
+        self._convert: Callable[[Any], _T] = (
+            _to_bool if self.type is bool else self.type  # type: ignore
+        )
         self.min = self.type(min_value) if min_value is not None else None  # type: ignore
         self.max = self.type(max_value) if max_value is not None else None  # type: ignore
         self.step = step
         self.decimals = decimals
         self.unit = unit
-        self.factor: float | None = None if unit == "" else vp.convert_length(unit)
+        self.factor: float | None = None if unit == "" else cached_convert_length(unit)
 
         self.choices: tuple[_T, ...] | None = None
         if choices is not None:
             self.choices = tuple(self.type(choice) for choice in choices)  # type: ignore
 
+        self._choice_set = frozenset(self.choices) if self.choices else None
+
     def set_value(self, value: _T) -> None:
         """Assign a value without validation."""
         self.value = value
@@ -234,15 +257,11 @@ class Param(Generic[_T]):
             returns True if the value was successfully updated
         """
         try:
-            # bool("False") == True, so we need to check for str first
-            if self.type is bool and isinstance(v, str):
-                v = v.lower() in ("true", "1", "yes", "y")
-
-            value = self.type(v)  # type: ignore
+            value = self._convert(v)
         except ValueError:
             return False
 
-        if self.choices and value not in self.choices:
+        if self._choice_set is not None and value not in self._choice_set:
             return False
 
         if self.min is not None:
@@ -1,11 +1,20 @@
 from __future__ import annotations
 
 import math
-from typing import Any
+from typing import Any, Sequence
 
 import numpy as np
+import shapely
 import vpype as vp
-from shapely.geometry import JOIN_STYLE, LineString
+from shapely.geometry import JOIN_STYLE
+
+from .utils import complex_to_2d
+
+_JOIN_STYLES = {
+    "round": JOIN_STYLE.round,
+    "mitre": JOIN_STYLE.mitre,
+    "bevel": JOIN_STYLE.bevel,
+}
 
 
 def _add_to_line_collection(geom: Any, lc: vp.LineCollection) -> None:
@@ -23,6 +32,29 @@ def _calc_buffer_resolution(radius: float, detail: float) -> int:
     return max(math.ceil(0.5 * math.pi * radius / detail) + 1, 3)
 
 
+def _path_geometries(lines: Sequence[np.ndarray] | np.ndarray) -> np.ndarray:
+    """Build the Shapely geometries to be buffered for a batch of paths.
+
+    Zero-length paths (including single-vertex paths) are replaced by a point at their first
+    vertex, as they cannot be built as line strings.
+    """
+    lengths = np.array([len(line) for line in lines])
+    starts = np.cumsum(lengths) - lengths
+    coords = complex_to_2d(np.concatenate(lines))
+
+    extents = np.maximum.reduceat(coords, starts) - np.minimum.reduceat(coords, starts)
+    degenerate = ~np.any(extents, axis=1)
+    if not degenerate.any():
+        return shapely.linestrings(coords, indices=np.repeat(np.arange(len(lines)), lengths))
+
+    geoms = shapely.points(coords[starts])
+    if not degenerate.all():
+        mask = np.repeat(~degenerate, lengths)
+        indices = np.repeat(np.arange(len(lines)), lengths)
+        shapely.linestrings(coords[mask], indices=indices[mask], out=geoms)
+    return geoms
+
+
 def stylize_path(
     line: np.ndarray, weight: int, pen_width: float, detail: float, join_style: str
 ) -> vp.LineCollection:
@@ -30,38 +62,60 @@ def stylize_path(
 
     Note: recursive buffering is to be avoided to properly control detail!
     """
+    return stylize_paths([line], weight, pen_width, detail, join_style)
+
+
+def stylize_paths(
+    lines: Sequence[np.ndarray] | np.ndarray,
+    weight: int,
+    pen_width: float,
+    detail: float,
+    join_style: str,
+) -> vp.LineCollection:
+    """Batched version of :func:`stylize_path`.
+
+    Each buffer radius is applied to all paths with a single vectorized call to Shapely. The
+    output is ordered as if :func:`stylize_path` was called on each path in turn. Paths of
+    identical length may be passed as the rows of a 2D array.
+    """
 
     if weight == 1:
-        return vp.LineCollection([line])
+        return vp.LineCollection(lines)
 
     lc = vp.LineCollection()
+    if len(lines) == 0:
+        return lc
 
     # convert vsketch str-based join style to the corresponding shapely value
-    shapely_join_style = getattr(JOIN_STYLE, join_style)
+    shapely_join_style = _JOIN_STYLES[join_style]
+
+    # paths to be used as starting point for buffering
+    geoms = _path_geometries(lines)
 
-    # path to be used as starting point for buffering
-    geom = LineString(vp.as_vector(line))
     if weight % 2 == 0:
         radius = pen_width / 2
-        _add_to_line_collection(
-            geom.buffer(
-                radius,
-                resolution=_calc_buffer_resolution(radius, detail),
-                join_style=shapely_join_style,
-            ),
-            lc,
-        )
+        radii = [radius]
     else:
         radius = 0.0
-        _add_to_line_collection(geom, lc)
-
+        radii = []
     for i in range((weight - 1) // 2):
         radius += pen_width
-        p = geom.buffer(
+        radii.append(radius)
+
+    buffers = [
+        shapely.buffer(
+            geoms,
             radius,
-            resolution=_calc_buffer_resolution(radius, detail),
+            quad_segs=_calc_buffer_resolution(radius, detail),
             join_style=shapely_join_style,
         )
-        _add_to_line_collection(p, lc)
+        for radius in radii
+    ]
+
+    for i, line in enumerate(lines):
+        if weight % 2 == 1:
+            lc.append(line)
+        for buffered in buffers:
+            _add_to_line_collection(buffered[i], lc)
 
     return lc
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import functools
 import os
 import pathlib
 from contextlib import contextmanager
-from typing import TYPE_CHECKING, Iterator
+from typing import TYPE_CHECKING, Iterable, Iterator
 
 import numpy as np
+import vpype as vp
 
 if TYPE_CHECKING:
     from . import Vsketch
@@ -22,6 +24,12 @@ class MatrixPopper:
         self._vsk.popMatrix()
 
 
+# template for resetting transforms, never handed out directly as users may modify the
+# current transform in place
+_IDENTITY = np.identity(3)
+_IDENTITY.setflags(write=False)
+
+
 class ResetMatrixContextManager:
     """The constructor will be called in both scenarii. __enter__() and
     __exit__() will only be called if used as a context manager (`with` statement)
@@ -30,20 +38,140 @@ class ResetMatrixContextManager:
     def __init__(self, vsk: Vsketch):
         self._vsk = vsk
         self._old_transform = vsk.transform
-        self._vsk.transform = np.identity(3)
+        self._vsk.transform = _IDENTITY.copy()
 
     def __enter__(self):
         # undo what we did in the contstructor and redo it after pushing the matrix
         self._vsk.transform = self._old_transform
         self._vsk.pushMatrix()
-        self._vsk.transform = np.identity(3)
+        self._vsk.transform = _IDENTITY.copy()
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         self._vsk.popMatrix()
 
 
 def complex_to_2d(line: np.ndarray) -> np.ndarray:
-    return np.vstack([line.real, line.imag]).T
+    """Convert a line of complex to a (N, 2) array of float.
+
+    For contiguous complex input, the result is a view and no data is copied.
+    """
+    return np.ascontiguousarray(line, dtype=complex).view(float).reshape(-1, 2)
+
+
+def as_float_array(values: Iterable[float]) -> np.ndarray:
+    """Convert a sequence or an iterable of float to a 1-dimension array of float.
+
+    Sequences (including arrays) are converted in bulk, while other iterables are consumed
+    with :func:`numpy.fromiter`.
+    """
+    if hasattr(values, "__len__"):
+        array = np.asarray(values, dtype=float)
+    else:
+        array = np.fromiter(values, dtype=float)
+    if len(array.shape) != 1:
+        raise ValueError("a 1-dimension sequence of float is expected")
+    return array
+
+
+def split_by_index(coords: np.ndarray, index: np.ndarray) -> list[np.ndarray]:
+    """Split coordinates as returned by ``shapely.get_coordinates(..., return_index=True)``
+    into one array per geometry."""
+    return np.split(coords, np.flatnonzero(np.diff(index)) + 1)
+
+
+@functools.lru_cache(maxsize=16)
+def cached_convert_length(unit: str) -> float:
+    """Memoized version of :func:`vpype.convert_length`, for units which are converted
+    repeatedly (e.g. on each redraw).
+    """
+    return vp.convert_length(unit)
+
+
+@functools.lru_cache(maxsize=256)
+def _ellipse_template(rw: float, rh: float, quantization: float) -> np.ndarray:
+    line = vp.ellipse(0, 0, rw, rh, quantization)
+    line.flags.writeable = False
+    return line
+
+
+@functools.lru_cache(maxsize=256)
+def _arc_template(
+    rw: float, rh: float, start: float, stop: float, quantization: float
+) -> np.ndarray:
+    line = vp.arc(0, 0, rw, rh, start, stop, quantization)
+    line.flags.writeable = False
+    return line
+
+
+def cached_ellipse(
+    x: float, y: float, rw: float, rh: float, quantization: float
+) -> np.ndarray:
+    """Same as :func:`vpype.ellipse`, but the origin-centered outline is cached and
+    translated, such that repeatedly drawing identical ellipses at different locations
+    does not require them to be sampled again.
+
+    Returns:
+        a new array, which the caller may modify
+    """
+    return _ellipse_template(rw, rh, quantization) + complex(x, y)
+
+
+def cached_arc(
+    x: float,
+    y: float,
+    rw: float,
+    rh: float,
+    start: float,
+    stop: float,
+    quantization: float,
+    padding: int = 0,
+) -> np.ndarray:
+    """Same as :func:`vpype.arc`, with the same caching strategy as :func:`cached_ellipse`.
+
+    The returned array has ``padding`` extra, uninitialized items at its end, which the
+    caller may use to close the arc without reallocating.
+
+    Returns:
+        a new array, which the caller may modify
+    """
+    template = _arc_template(rw, rh, start, stop, quantization)
+    line = np.empty(len(template) + padding, dtype=complex)
+    np.add(template, complex(x, y), out=line[: len(template)])
+    return line
+
+
+def _ellipse_mode_center(
+    x: float, y: float, w: float, h: float
+) -> tuple[float, float, float, float]:
+    return x, y, w * 0.5, h * 0.5
+
+
+def _ellipse_mode_radius(
+    x: float, y: float, w: float, h: float
+) -> tuple[float, float, float, float]:
+    return x, y, w, h
+
+
+def _ellipse_mode_corner(
+    x: float, y: float, w: float, h: float
+) -> tuple[float, float, float, float]:
+    rw, rh = w * 0.5, h * 0.5
+    return x + rw, y + rh, rw, rh
+
+
+def _ellipse_mode_corners(
+    x: float, y: float, w: float, h: float
+) -> tuple[float, float, float, float]:
+    # (x, y) and (w, h) are opposite corners
+    return (x + w) * 0.5, (y + h) * 0.5, abs(w - x) * 0.5, abs(h - y) * 0.5
+
+
+_ELLIPSE_MODES = {
+    "center": _ellipse_mode_center,
+    "radius": _ellipse_mode_radius,
+    "corner": _ellipse_mode_corner,
+    "corners": _ellipse_mode_corners,
+}
 
 
 def compute_ellipse_mode(
@@ -62,28 +190,74 @@ def compute_ellipse_mode(
     Returns:
         tuple of center X, Y coordinates and w, h radii
     """
-    if mode == "center":
-        return x, y, w / 2, h / 2
-    elif mode == "radius":
-        return x, y, w, h
-    elif mode == "corner":
-        return x + w / 2, y + h / 2, w / 2, h / 2
-    elif mode == "corners":
-        # Find center
-        xmin, xmax = min(x, w), max(x, w)
-        ymin, ymax = min(y, h), max(y, h)
-        c_x = xmax - 0.5 * (xmax - xmin)
-        c_y = ymax - 0.5 * (ymax - ymin)
-        width, height = xmax - xmin, ymax - ymin
-        return c_x, c_y, width / 2, height / 2
-    else:
+    try:
+        func = _ELLIPSE_MODES[mode]
+    except KeyError:
+        raise ValueError("mode must be one of 'corner', 'corners', 'center', 'radius'")
+    return func(x, y, w, h)
+
+
+def _rect_mode_corner(
+    x: float, y: float, w: float, h: float
+) -> tuple[float, float, float, float]:
+    return x, y, w, h
+
+
+def _rect_mode_corners(
+    x: float, y: float, w: float, h: float
+) -> tuple[float, float, float, float]:
+    #  Find top-left corner
+    tl_x, tl_y = min(x, w), min(y, h)
+    return tl_x, tl_y, max(x, w) - tl_x, max(y, h) - tl_y
+
+
+def _rect_mode_center(
+    x: float, y: float, w: float, h: float
+) -> tuple[float, float, float, float]:
+    return x - w / 2, y - h / 2, w, h
+
+
+def _rect_mode_radius(
+    x: float, y: float, w: float, h: float
+) -> tuple[float, float, float, float]:
+    return x - w, y - h, 2 * w, 2 * h
+
+
+_RECT_MODES = {
+    "corner": _rect_mode_corner,
+    "corners": _rect_mode_corners,
+    "center": _rect_mode_center,
+    "radius": _rect_mode_radius,
+}
+
+
+def compute_rect_mode(
+    mode: str, x: float, y: float, w: float, h: float
+) -> tuple[float, float, float, float]:
+    """Interpret parameters based on :meth:`rectMode` and compute the rectangle top-left
+    corner and size.
+
+    Args:
+        mode: :meth:`rectMode` mode
+        x: first parameter
+        y: second parameter
+        w: third parameter
+        h: fourth parameter
+
+    Returns:
+        tuple of top-left corner X, Y coordinates and width, height
+    """
+    try:
+        func = _RECT_MODES[mode]
+    except KeyError:
         raise ValueError("mode must be one of 'corner', 'corners', 'center', 'radius'")
+    return func(x, y, w, h)
 
 
 @contextmanager
 def working_directory(path: pathlib.Path) -> Iterator:
     prev_cwd = os.getcwd()
-    os.chdir(str(path))
+    os.chdir(path)
     try:
         yield
     finally:
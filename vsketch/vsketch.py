@@ -8,18 +8,38 @@ from numbers import Real
 from typing import Any, Iterable, Sequence, TextIO, TypeVar, cast, overload
 
 import numpy as np
+import shapely
 import vpype as vp
 import vpype_cli
 from pnoise import Noise
-from shapely.geometry import Polygon
+from shapely.geometry import (
+    GeometryCollection,
+    LineString,
+    MultiLineString,
+    MultiPoint,
+    MultiPolygon,
+    Point,
+    Polygon,
+)
+from shapely.geometry.base import BaseGeometry
 
 from .curves import cubic_bezier_path, cubic_bezier_point, cubic_bezier_tangent
 from .display import display
 from .easing import EASING_FUNCTIONS
 from .fill import generate_fill
 from .shape import Shape
-from .style import stylize_path
-from .utils import MatrixPopper, ResetMatrixContextManager, complex_to_2d, compute_ellipse_mode
+from .style import stylize_paths
+from .utils import (
+    MatrixPopper,
+    ResetMatrixContextManager,
+    as_float_array,
+    cached_arc,
+    cached_ellipse,
+    complex_to_2d,
+    compute_ellipse_mode,
+    compute_rect_mode,
+    split_by_index,
+)
 
 __all__ = ["Vsketch"]
 
@@ -131,7 +151,8 @@ class Vsketch:
         # The top 2x2 sub-matrix of the current transform corresponds to how the base vectors
         # would be transformed. We thus take their (transformed) length and use their maximum
         # value as scaling factor.
-        scaling = max(math.hypot(*self.transform[0:2, 0]), math.hypot(*self.transform[0:2, 1]))
+        sx, shx, shy, sy = self._transform_stack[-1][:2, :2].ravel().tolist()
+        scaling = max(math.hypot(sx, shy), math.hypot(shx, sy))
 
         return self._detail / scaling
 
@@ -482,7 +503,8 @@ class Vsketch:
         else:
             scale_y = float(sy)
 
-        self.transform = self.transform @ np.diag([scale_x, scale_y, 1])
+        # right-multiplying by a diagonal matrix scales the matrix columns
+        self.transform = self.transform * (scale_x, scale_y, 1.0)
 
     def rotate(self, angle: float, degrees: bool = False) -> None:
         """Apply a rotation to the current transformation matrix.
@@ -497,16 +519,15 @@ class Vsketch:
         """
 
         if degrees:
-            angle = angle * np.pi / 180.0
-
-        self.transform = self.transform @ np.array(
-            [
-                (np.cos(angle), -np.sin(angle), 0),
-                (np.sin(angle), np.cos(angle), 0),
-                (0, 0, 1),
-            ],
-            dtype=float,
-        )
+            angle = angle * math.pi / 180.0
+
+        # right-multiplying by a rotation matrix only affects the first two columns
+        cos, sin = math.cos(angle), math.sin(angle)
+        transform = self.transform
+        rotated = transform.copy()
+        rotated[:, 0] = transform[:, 0] * cos + transform[:, 1] * sin
+        rotated[:, 1] = transform[:, 1] * cos - transform[:, 0] * sin
+        self.transform = rotated
 
     def translate(self, dx: float, dy: float) -> None:
         """Apply a translation to the current transformation matrix.
@@ -516,9 +537,10 @@ class Vsketch:
             dy: translation along Y axis
         """
 
-        self.transform = self.transform @ np.array(
-            [(1, 0, dx), (0, 1, dy), (0, 0, 1)], dtype=float
-        )
+        # right-multiplying by a translation matrix only affects the last column
+        transform = self.transform.copy()
+        transform[:, 2] += transform[:, 0] * dx + transform[:, 1] * dy
+        self.transform = transform
 
     def line(self, x1: float, y1: float, x2: float, y2: float) -> None:
         """Draw a line.
@@ -530,7 +552,8 @@ class Vsketch:
             y2: Y coordinate of ending point
         """
 
-        self._add_polygon(np.array([x1 + y1 * 1j, x2 + y2 * 1j], dtype=complex))
+        # complex() raises TypeError for non-numeric coordinates
+        self._add_polygon(np.array((complex(x1, y1), complex(x2, y2)), dtype=complex))
 
     def circle(
         self,
@@ -618,7 +641,7 @@ class Vsketch:
         """
         if mode is None:
             mode = self._ellipse_mode
-        line = vp.ellipse(*compute_ellipse_mode(mode, x, y, w, h), self.epsilon)
+        line = cached_ellipse(*compute_ellipse_mode(mode, x, y, w, h), self.epsilon)
         self._add_polygon(line)
 
     def arc(
@@ -671,12 +694,16 @@ class Vsketch:
             mode = self._ellipse_mode
 
         cx, cy, rw, rh = compute_ellipse_mode(mode, x, y, w, h)
-        line = vp.arc(cx, cy, rw, rh, start, stop, self.epsilon)
-        if close == "chord":
-            line = np.append(line, [line[0]])
+        if close == "no":
+            line = cached_arc(cx, cy, rw, rh, start, stop, self.epsilon)
+        elif close == "chord":
+            line = cached_arc(cx, cy, rw, rh, start, stop, self.epsilon, padding=1)
+            line[-1] = line[0]
         elif close == "pie":
-            line = np.append(line, [complex(cx, cy), line[0]])
-        elif close != "no":
+            line = cached_arc(cx, cy, rw, rh, start, stop, self.epsilon, padding=2)
+            line[-2] = complex(cx, cy)
+            line[-1] = line[0]
+        else:
             raise ValueError("close must be one of 'no', 'chord', 'pie'")
 
         self._add_polygon(line)
@@ -729,19 +756,26 @@ class Vsketch:
             x: X coordinate
             y: Y coordinate
         """
-        if self._cur_stroke:
-            center = self._transform_line(np.array([complex(x, y)]))
-            circle = vp.circle(
-                center[0].real, center[0].imag, self.strokePenWidth / 2, self.epsilon
-            )
-            lc = vp.LineCollection(
-                stylize_path(
-                    circle,
-                    weight=self._stroke_weight,
-                    pen_width=self.strokePenWidth,
-                    detail=self._detail,
-                    join_style="round",
-                )
+        self._add_points(np.array([complex(x, y)]))
+
+    def _add_points(self, points: np.ndarray) -> None:
+        """Draw several points at once.
+
+        The points are transformed together, and a single circle outline is computed and
+        translated to each point.
+
+        Args:
+            points (numpy array of complex): the points' coordinates
+        """
+        if self._cur_stroke and len(points) > 0:
+            centers = self._transform_line(points)
+            circle = vp.circle(0, 0, self.strokePenWidth / 2, self.epsilon)
+            lc = stylize_paths(
+                circle + centers[:, np.newaxis],
+                weight=self._stroke_weight,
+                pen_width=self.strokePenWidth,
+                detail=self._detail,
+                join_style="round",
             )
             self._document.add(lc, self._cur_stroke)
 
@@ -831,19 +865,15 @@ class Vsketch:
         if mode is None:
             mode = self._rect_mode
 
-        if mode == "corner":
-            line = vp.rect(x, y, w, h, tl, tr, br, bl, self.epsilon)
-        elif mode == "corners":
-            #  Find top-left corner
-            tl_x, tl_y = min(x, w), min(y, h)
-            width, height = max(x, w) - tl_x, max(y, h) - tl_y
-            line = vp.rect(tl_x, tl_y, width, height, tl, tr, br, bl, self.epsilon)
-        elif mode == "center":
-            line = vp.rect(x - w / 2, y - h / 2, w, h, tl, tr, br, bl, self.epsilon)
-        elif mode == "radius":
-            line = vp.rect(x - w, y - h, 2 * w, 2 * h, tl, tr, br, bl, self.epsilon)
+        rect_x, rect_y, rect_w, rect_h = compute_rect_mode(mode, x, y, w, h)
+        if tl == tr == br == bl == 0:
+            # plain rectangles don't need vpype's rounded corner logic
+            x2, y2 = rect_x + rect_w, rect_y + rect_h
+            line = np.empty(5, dtype=complex)
+            line.real = (rect_x, rect_x, x2, x2, rect_x)
+            line.imag = (rect_y, y2, y2, rect_y, rect_y)
         else:
-            raise ValueError("mode must be one of 'corner', 'corners', 'center', 'radius'")
+            line = vp.rect(rect_x, rect_y, rect_w, rect_h, tl, tr, br, bl, self.epsilon)
 
         self._add_polygon(line)
 
@@ -940,9 +970,9 @@ class Vsketch:
             x4: X coordinate of the last vertex
             y4: Y coordinate of the last vertex
         """
+        p1 = complex(x1, y1)
         line = np.array(
-            [x1 + y1 * 1j, x2 + y2 * 1j, x3 + y3 * 1j, x4 + y4 * 1j, x1 + y1 * 1j],
-            dtype=complex,
+            (p1, complex(x2, y2), complex(x3, y3), complex(x4, y4), p1), dtype=complex
         )
         self._add_polygon(line)
 
@@ -965,9 +995,8 @@ class Vsketch:
             y3: Y coordinate of the third corner
         """
 
-        line = np.array(
-            [x1 + y1 * 1j, x2 + y2 * 1j, x3 + y3 * 1j, x1 + y1 * 1j], dtype=complex
-        )
+        p1 = complex(x1, y1)
+        line = np.array((p1, complex(x2, y2), complex(x3, y3), p1), dtype=complex)
         self._add_polygon(line)
 
     def polygon(
@@ -1009,6 +1038,7 @@ class Vsketch:
             holes: list of holes inside the polygon
             close: the polygon is closed if True
         """
+        buffer = None
         if y is None:
             try:
                 if hasattr(x, "__len__"):
@@ -1028,9 +1058,15 @@ class Vsketch:
                 )
         else:
             try:
-                line = np.array(
-                    [complex(c[0], c[1]) for c in zip(x, y)], dtype=complex  # type: ignore
-                )
+                xs = as_float_array(x)  # type: ignore
+                ys = as_float_array(y)
+                count = min(len(xs), len(ys))
+
+                # spare slot for the closing vertex, if any
+                buffer = np.empty(count + 1, dtype=complex)
+                buffer.real[:count] = xs[:count]
+                buffer.imag[:count] = ys[:count]
+                line = buffer[:count]
             except:
                 raise ValueError(
                     "when both X and Y are provided, they must be sequences o float"
@@ -1039,12 +1075,19 @@ class Vsketch:
         hole_lines = []
         try:
             for hole in holes:
-                hole_lines.append(np.array([complex(c[0], c[1]) for c in hole], dtype=complex))
+                hole_data = np.asarray(hole, dtype=float)
+                if len(hole_data.shape) != 2 or hole_data.shape[1] < 2:
+                    raise ValueError()
+                hole_lines.append(hole_data[:, 0] + 1j * hole_data[:, 1])
         except:
             raise ValueError("holes must be a sequence of sequence of 2D coordinates")
 
         if close and line[-1] != line[0]:
-            line = np.hstack([line, line[0]])
+            if buffer is not None:
+                buffer[-1] = line[0]
+                line = buffer
+            else:
+                line = np.hstack([line, line[0]])
 
         self._add_polygon(line, holes=hole_lines)
 
@@ -1057,38 +1100,32 @@ class Vsketch:
         Args:
             shape (Shapely geometry): a supported shapely geometry object
         """
-        if getattr(shape, "is_empty", False):
+        if not isinstance(shape, BaseGeometry):
+            raise ValueError("the input must be a supported Shapely geometry")
+        if shape.is_empty:
             return
 
-        try:
-            if shape.geom_type == "GeometryCollection":
-                for geom in shape.geoms:
-                    self.geometry(geom)
-            elif shape.geom_type in ["LineString", "LinearRing"]:
-                self.polygon(shape.coords)
-            elif shape.geom_type == "MultiLineString":
-                for ls in shape.geoms:
-                    self.polygon(ls.coords)
-            elif shape.geom_type in ["Polygon", "MultiPolygon"]:
-                if shape.geom_type == "Polygon":
-                    geoms = [shape]
-                else:
-                    geoms = shape.geoms
-                for p in geoms:
-                    self.polygon(
-                        p.exterior.coords, holes=[hole.coords for hole in p.interiors]
-                    )
-            elif shape.geom_type in ["Point", "MultiPoint"]:
-                if shape.geom_type == "Point":
-                    geoms = [shape]
-                else:
-                    geoms = shape.geoms
-                for p in geoms:
-                    self.point(p.x, p.y)
-            else:
-                raise ValueError(f"unsupported Shapely geometry: {shape.geom_type}")
-        except AttributeError:
-            raise ValueError("the input must be a supported Shapely geometry")
+        if isinstance(shape, GeometryCollection):
+            for geom in shape.geoms:
+                self.geometry(geom)
+        elif isinstance(shape, (LineString, MultiLineString)):
+            coords, line_idx = shapely.get_coordinates(
+                shapely.get_parts(shape), return_index=True
+            )
+            for line in split_by_index(coords.view(complex).ravel(), line_idx):
+                self._add_polygon(line)
+        elif isinstance(shape, (Polygon, MultiPolygon)):
+            rings, polygon_idx = shapely.get_rings(shapely.get_parts(shape), return_index=True)
+            coords, ring_idx = shapely.get_coordinates(rings, return_index=True)
+            ring_lines = split_by_index(coords.view(complex).ravel(), ring_idx)
+            starts = np.flatnonzero(np.diff(polygon_idx, prepend=-1))
+            ends = np.append(starts[1:], len(polygon_idx))
+            for start, end in zip(starts, ends):
+                self._add_polygon(ring_lines[start], holes=ring_lines[start + 1 : end])
+        elif isinstance(shape, (Point, MultiPoint)):
+            self._add_points(shapely.get_coordinates(shape).view(complex).ravel())
+        else:
+            raise ValueError(f"unsupported Shapely geometry: {shape.geom_type}")
 
     def bezier(
         self,
@@ -1210,8 +1247,7 @@ class Vsketch:
 
         self.geometry(area)
         self.geometry(lines)
-        for point in points.geoms:
-            self.point(point.x, point.y)
+        self._add_points(shapely.get_coordinates(points).view(complex).ravel())
 
     def sketch(self, sub_sketch: Vsketch) -> None:
         """Draw the content of another Vsketch.
@@ -1237,12 +1273,18 @@ class Vsketch:
             self._document.add(lc, layer_id)
 
     def _transform_line(self, line: np.ndarray) -> np.ndarray:
-        """Apply the current transformation matrix to a line."""
+        """Apply the current transformation matrix to a line.
 
-        transformed_line = self.transform @ np.vstack(
-            [line.real, line.imag, np.ones(len(line))]
-        ).T.reshape(len(line), 3, 1)
-        return transformed_line[:, 0, 0] + 1j * transformed_line[:, 1, 0]
+        The transform is applied to a (N, 2) float view of the line and written in place into
+        the float view of the complex output, with no intermediate array.
+        """
+
+        transform = self.transform
+        result = np.empty(len(line), dtype=complex)
+        points = complex_to_2d(result)
+        np.matmul(complex_to_2d(line), transform[:2, :2].T, out=points)
+        points += transform[:2, 2]
+        return result
 
     def _add_polygon(self, exterior: np.ndarray, holes: Iterable[np.ndarray] = ()) -> None:
         """Add a polygon with optional holes to the sketch.
@@ -1259,17 +1301,13 @@ class Vsketch:
         transformed_holes = [self._transform_line(hole) for hole in holes]
 
         if self._cur_stroke:
-            lc = vp.LineCollection()
-            for line in [transformed_exterior] + transformed_holes:
-                lc.extend(
-                    stylize_path(
-                        line,
-                        weight=self._stroke_weight,
-                        pen_width=self.strokePenWidth,
-                        detail=self._detail,
-                        join_style=self._join_style,
-                    )
-                )
+            lc = stylize_paths(
+                [transformed_exterior] + transformed_holes,
+                weight=self._stroke_weight,
+                pen_width=self.strokePenWidth,
+                detail=self._detail,
+                join_style=self._join_style,
+            )
             self._document.add(lc, self._cur_stroke)
 
         if self._cur_fill and len(transformed_exterior) > 2: